@@ -9,6 +9,7 @@ Memory Integration:
 - Saves fix outcomes and learnings after session
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 # Memory integration for cross-session learning
@@ -19,6 +20,7 @@ from security.tool_input_validator import get_safe_tool_input
 from task_logger import (
     LogEntryType,
     LogPhase,
+    TaskLogger,
     get_task_logger,
 )
 
@@ -27,20 +29,41 @@ from .criteria import get_qa_signoff_status
 # Configuration
 QA_PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
 
+# Tools whose full result is stored in the task log detail view
+DETAIL_TOOLS = frozenset({"Read", "Grep", "Bash", "Edit", "Write"})
+
 
 # =============================================================================
 # PROMPT LOADING
 # =============================================================================
 
 
+@lru_cache(maxsize=1)
 def load_qa_fixer_prompt() -> str:
-    """Load the QA fixer agent prompt."""
+    """Load the QA fixer agent prompt (read once per process)."""
     prompt_file = QA_PROMPTS_DIR / "qa_fixer.md"
     if not prompt_file.exists():
         raise FileNotFoundError(f"QA fixer prompt not found: {prompt_file}")
     return prompt_file.read_text()
 
 
+def _flush_text(text_parts: list[str], task_logger: TaskLogger | None) -> None:
+    """Print and log buffered text blocks as a single write, then clear them."""
+    if not text_parts:
+        return
+    text = "".join(text_parts)
+    text_parts.clear()
+    print(text, end="", flush=True)
+    # Log text to task logger (persist without double-printing)
+    if task_logger and text.strip():
+        task_logger.log(
+            text,
+            LogEntryType.TEXT,
+            LogPhase.VALIDATION,
+            print_to_console=False,
+        )
+
+
 # =============================================================================
 # QA FIXER SESSION
 # =============================================================================
@@ -128,7 +151,7 @@ async def run_qa_fixer_session(
         await client.query(prompt)
         debug_success("qa_fixer", "Query sent successfully")
 
-        response_text = ""
+        response_chunks: list[str] = []
         debug("qa_fixer", "Starting to receive response stream...")
         async for msg in client.receive_response():
             msg_type = type(msg).__name__
@@ -140,21 +163,17 @@ async def run_qa_fixer_session(
             )
 
             if msg_type == "AssistantMessage" and hasattr(msg, "content"):
+                # Batch consecutive text blocks into one write/log entry,
+                # flushing before each tool call to preserve ordering
+                text_parts: list[str] = []
                 for block in msg.content:
                     block_type = type(block).__name__
 
                     if block_type == "TextBlock" and hasattr(block, "text"):
-                        response_text += block.text
-                        print(block.text, end="", flush=True)
-                        # Log text to task logger (persist without double-printing)
-                        if task_logger and block.text.strip():
-                            task_logger.log(
-                                block.text,
-                                LogEntryType.TEXT,
-                                LogPhase.VALIDATION,
-                                print_to_console=False,
-                            )
+                        response_chunks.append(block.text)
+                        text_parts.append(block.text)
                     elif block_type == "ToolUseBlock" and hasattr(block, "name"):
+                        _flush_text(text_parts, task_logger)
                         tool_name = block.name
                         tool_input_display = None
                         tool_count += 1
@@ -198,6 +217,7 @@ async def run_qa_fixer_session(
                             else:
                                 print(f"   Input: {input_str}", flush=True)
                         current_tool = tool_name
+                _flush_text(text_parts, task_logger)
 
             elif msg_type == "UserMessage" and hasattr(msg, "content"):
                 for block in msg.content:
@@ -206,14 +226,20 @@ async def run_qa_fixer_session(
                     if block_type == "ToolResultBlock":
                         is_error = getattr(block, "is_error", False)
                         result_content = getattr(block, "content", "")
+                        # Stringify once; large outputs are sliced several times below
+                        result_str = (
+                            result_content
+                            if isinstance(result_content, str)
+                            else str(result_content)
+                        )
 
                         if is_error:
                             debug_error(
                                 "qa_fixer",
                                 f"Tool error: {current_tool}",
-                                error=str(result_content)[:200],
+                                error=result_str[:200],
                             )
-                            error_str = str(result_content)[:500]
+                            error_str = result_str[:500]
                             print(f"   [Error] {error_str}", flush=True)
                             if task_logger and current_tool:
                                 # Store full error in detail for expandable view
@@ -221,33 +247,27 @@ async def run_qa_fixer_session(
                                     current_tool,
                                     success=False,
                                     result=error_str[:100],
-                                    detail=str(result_content),
+                                    detail=result_str,
                                     phase=LogPhase.VALIDATION,
                                 )
                         else:
                             debug_detailed(
                                 "qa_fixer",
                                 f"Tool success: {current_tool}",
-                                result_length=len(str(result_content)),
+                                result_length=len(result_str),
                             )
                             if verbose:
-                                result_str = str(result_content)[:200]
-                                print(f"   [Done] {result_str}", flush=True)
+                                print(f"   [Done] {result_str[:200]}", flush=True)
                             else:
                                 print("   [Done]", flush=True)
                             if task_logger and current_tool:
                                 # Store full result in detail for expandable view
                                 detail_content = None
-                                if current_tool in (
-                                    "Read",
-                                    "Grep",
-                                    "Bash",
-                                    "Edit",
-                                    "Write",
+                                if (
+                                    current_tool in DETAIL_TOOLS
+                                    and len(result_str) < 50000
                                 ):
-                                    result_str = str(result_content)
-                                    if len(result_str) < 50000:
-                                        detail_content = result_str
+                                    detail_content = result_str
                                 task_logger.tool_end(
                                     current_tool,
                                     success=True,
@@ -258,6 +278,7 @@ async def run_qa_fixer_session(
                         current_tool = None
 
         print("\n" + "-" * 70 + "\n")
+        response_text = "".join(response_chunks)
 
         # Check if fixes were applied
         status = get_qa_signoff_status(spec_dir)
@@ -34,6 +34,7 @@ from .criteria import (
 )
 from .fixer import run_qa_fixer_session
 from .report import (
+    RECURRING_ISSUE_THRESHOLD,
     create_manual_test_plan,
     escalate_to_human,
     get_iteration_history,
@@ -93,10 +94,12 @@ async def run_qa_validation_loop(
         max_iterations=MAX_QA_ITERATIONS,
     )
 
-    print("\n" + "=" * 70)
-    print("  QA VALIDATION LOOP")
-    print("  Self-validating quality assurance")
-    print("=" * 70)
+    print(
+        f"\n{'=' * 70}\n"
+        "  QA VALIDATION LOOP\n"
+        "  Self-validating quality assurance\n"
+        f"{'=' * 70}"
+    )
 
     # Initialize task logger for the validation phase
     task_logger = get_task_logger(spec_dir)
@@ -264,14 +267,16 @@ async def run_qa_validation_loop(
             )
             record_iteration(spec_dir, qa_iteration, "approved", [], iteration_duration)
 
-            print("\n" + "=" * 70)
-            print("  ✅ QA APPROVED")
-            print("=" * 70)
-            print("\nAll acceptance criteria verified.")
-            print("The implementation is production-ready.")
-            print("\nNext steps:")
-            print("  1. Review the auto-claude/* branch")
-            print("  2. Create a PR and merge to main")
+            print(
+                f"\n{'=' * 70}\n"
+                "  ✅ QA APPROVED\n"
+                f"{'=' * 70}\n"
+                "\nAll acceptance criteria verified.\n"
+                "The implementation is production-ready.\n"
+                "\nNext steps:\n"
+                "  1. Review the auto-claude/* branch\n"
+                "  2. Create a PR and merge to main"
+            )
 
             # End validation phase successfully
             if task_logger:
@@ -323,8 +328,6 @@ async def run_qa_validation_loop(
             )
 
             if has_recurring:
-                from .report import RECURRING_ISSUE_THRESHOLD
-
                 debug_error(
                     "qa_loop",
                     "Recurring issues detected - escalating to human",
@@ -472,11 +475,13 @@ async def run_qa_validation_loop(
         iterations=qa_iteration,
         max_iterations=MAX_QA_ITERATIONS,
     )
-    print("\n" + "=" * 70)
-    print("  ⚠️  QA VALIDATION INCOMPLETE")
-    print("=" * 70)
-    print(f"\nReached maximum iterations ({MAX_QA_ITERATIONS}) without approval.")
-    print("\nRemaining issues require human review:")
+    print(
+        f"\n{'=' * 70}\n"
+        "  ⚠️  QA VALIDATION INCOMPLETE\n"
+        f"{'=' * 70}\n"
+        f"\nReached maximum iterations ({MAX_QA_ITERATIONS}) without approval.\n"
+        "\nRemaining issues require human review:"
+    )
 
     # Show iteration summary
     history = get_iteration_history(spec_dir)
@@ -265,7 +265,8 @@ async def escalate_to_human(
 
     escalation_file = spec_dir / "QA_ESCALATION.md"
 
-    content = f"""# QA Escalation - Human Intervention Required
+    parts: list[str] = [
+        f"""# QA Escalation - Human Intervention Required
 
 **Generated**: {datetime.now(timezone.utc).isoformat()}
 **Iteration**: {iteration}/{MAX_QA_ITERATIONS}
@@ -283,9 +284,10 @@ async def escalate_to_human(
 These issues have appeared {RECURRING_ISSUE_THRESHOLD}+ times without being resolved:
 
 """
+    ]
 
     for i, issue in enumerate(recurring_issues, 1):
-        content += f"""### {i}. {issue.get("title", "Unknown Issue")}
+        parts.append(f"""### {i}. {issue.get("title", "Unknown Issue")}
 
 - **File**: {issue.get("file", "N/A")}
 - **Line**: {issue.get("line", "N/A")}
@@ -293,18 +295,18 @@ These issues have appeared {RECURRING_ISSUE_THRESHOLD}+ times without being reso
 - **Occurrences**: {issue.get("occurrence_count", "N/A")}
 - **Description**: {issue.get("description", "No description")}
 
-"""
+""")
 
-    content += """## Most Common Issues (All Time)
+    parts.append("""## Most Common Issues (All Time)
 
-"""
+""")
     for issue in summary.get("most_common", []):
-        content += f"- **{issue['title']}** ({issue['occurrences']} occurrences)"
+        parts.append(f"- **{issue['title']}** ({issue['occurrences']} occurrences)")
         if issue.get("file"):
-            content += f" in `{issue['file']}`"
-        content += "\n"
+            parts.append(f" in `{issue['file']}`")
+        parts.append("\n")
 
-    content += """
+    parts.append("""
 
 ## Recommended Actions
 
@@ -322,9 +324,9 @@ These issues have appeared {RECURRING_ISSUE_THRESHOLD}+ times without being reso
 - `QA_FIX_REQUEST.md` - Latest fix request
 - `qa_report.md` - Latest QA report
 - `implementation_plan.json` - Full iteration history
-"""
+""")
 
-    escalation_file.write_text(content)
+    escalation_file.write_text("".join(parts))
     print(f"\n📝 Escalation file created: {escalation_file}")
 
 